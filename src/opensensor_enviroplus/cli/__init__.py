@@ -0,0 +1,30 @@
+"""Command-line interface for opensensor-enviroplus."""
+
+import functools
+import importlib.metadata
+import sys
+
+
+@functools.cache
+def package_version() -> str:
+    """Installed package version ("dev" when running from an uninstalled tree)."""
+    try:
+        return importlib.metadata.version("opensensor-enviroplus")
+    except importlib.metadata.PackageNotFoundError:
+        return "dev"
+
+
+def main() -> None:
+    """
+    Console-script entry point.
+
+    A bare `opensensor --version` is answered here, before Typer, Click and Rich
+    are imported; everything else is handed to the Typer app.
+    """
+    if sys.argv[1:] in (["--version"], ["-v"]):
+        print(f"OpenSensor Enviro+ v{package_version()}")
+        return
+
+    from opensensor_enviroplus.cli.app import app
+
+    app()
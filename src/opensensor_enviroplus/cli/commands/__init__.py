@@ -0,0 +1 @@
+"""CLI commands, one module per command, loaded lazily by the top-level app."""
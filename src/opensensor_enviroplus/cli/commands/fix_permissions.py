@@ -0,0 +1,84 @@
+"""Fix sensor permissions (requires sudo)."""
+
+import os
+from pathlib import Path
+
+import typer
+
+from opensensor_enviroplus.cli.common import console, print_banner
+
+app = typer.Typer(add_completion=False, rich_markup_mode="rich")
+
+
+@app.command("fix-permissions")
+def fix_permissions():
+    """
+    Fix serial port permissions for PMS5003 sensor.
+
+    Requires sudo. Adds user to groups and creates udev rules.
+    Reboot required after running.
+    """
+    import grp
+    import subprocess
+
+    print_banner()
+    console().print("[bold]Fixing sensor permissions...[/bold]\n")
+
+    # Check if running as root
+    if os.geteuid() != 0:
+        console().print("[red]ERROR: Requires sudo[/red]")
+        console().print("\nRun: [cyan]sudo $(which opensensor) fix-permissions[/cyan]\n")
+        raise typer.Exit(1)
+
+    # Get the actual user (not root)
+    user = os.environ.get("SUDO_USER") or os.environ.get("USER")
+    if not user or user == "root":
+        console().print("[red]ERROR: Could not determine user.[/red]")
+        console().print("Run with sudo from a regular user account.\n")
+        raise typer.Exit(1)
+
+    console().print(f"User: [cyan]{user}[/cyan]\n")
+
+    # Add user to required groups
+    groups = ["dialout", "i2c", "gpio"]
+    for group in groups:
+        try:
+            grp.getgrnam(group)
+            result = subprocess.run(
+                ["usermod", "-aG", group, user],
+                capture_output=True,
+                text=True,
+            )
+            if result.returncode == 0:
+                console().print(f"  [green]Added to {group}[/green]")
+            else:
+                console().print(f"  [yellow]Warning: {group} - {result.stderr}[/yellow]")
+        except KeyError:
+            console().print(f"  [dim]Skipped {group} (not found)[/dim]")
+
+    # Create udev rule for PMS5003 serial port
+    # We support both /dev/ttyAMA0 and /dev/serial0 (and others if configured)
+    # But udev rules match on KERNEL name, which is usually ttyAMA0 or ttyS0
+
+    # Try to detect which one is being used or just add rules for both common ones
+    udev_rules = [
+        'KERNEL=="ttyAMA0", GROUP="dialout", MODE="0660"',
+        'KERNEL=="ttyS0", GROUP="dialout", MODE="0660"',
+        'SYMLINK=="serial0", GROUP="dialout", MODE="0660"',
+    ]
+
+    udev_file = Path("/etc/udev/rules.d/99-pms5003.rules")
+
+    try:
+        udev_file.write_text("\n".join(udev_rules) + "\n")
+        console().print(f"\n[green]Created udev rule[/green]: {udev_file}")
+    except OSError as e:
+        console().print(f"[red]ERROR: {e}[/red]")
+        raise typer.Exit(1) from e
+
+    # Reload udev rules
+    subprocess.run(["udevadm", "control", "--reload-rules"], capture_output=True)
+    subprocess.run(["udevadm", "trigger", "--subsystem-match=tty"], capture_output=True)
+
+    console().print("\n[bold green]Done![/bold green]")
+    console().print("\n[yellow]REBOOT REQUIRED[/yellow]: Run [cyan]sudo reboot[/cyan]\n")
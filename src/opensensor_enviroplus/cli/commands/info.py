@@ -0,0 +1,185 @@
+"""Show configuration, sensor status and data statistics."""
+
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import typer
+
+from opensensor_enviroplus.cli import package_version
+from opensensor_enviroplus.cli.common import (
+    DEFAULT_ENV,
+    DEFAULT_HEALTH,
+    DEFAULT_OUTPUT,
+    check_sensor_availability,
+    console,
+    load_sensor_config,
+    print_banner,
+    service_manager,
+)
+from opensensor_enviroplus.utils.env import parse_env_file
+
+app = typer.Typer(add_completion=False, rich_markup_mode="rich")
+
+
+# Hand subtrees to worker threads once one directory level is at least this wide
+_PARALLEL_MIN_DIRS = 16
+
+
+def _scan_dir(path: str, sizes: bool) -> tuple[int, int, list[str]]:
+    """Scan one directory. Returns (parquet_count, parquet_bytes, subdirectories)."""
+    count = 0
+    total = 0
+    subdirs: list[str] = []
+    try:
+        it = os.scandir(path)
+    except (FileNotFoundError, NotADirectoryError, PermissionError):
+        return count, total, subdirs
+    with it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            elif entry.name.endswith(".parquet"):
+                count += 1
+                if sizes:
+                    total += entry.stat(follow_symlinks=False).st_size
+    return count, total, subdirs
+
+
+def _walk_parquet(root: str, sizes: bool) -> tuple[int, int]:
+    """Depth-first walk of root, summing _scan_dir results."""
+    count = 0
+    total = 0
+    stack = [root]
+    while stack:
+        c, t, subdirs = _scan_dir(stack.pop(), sizes)
+        count += c
+        total += t
+        stack.extend(subdirs)
+    return count, total
+
+
+def _scan_parquet(root: str, sizes: bool = True) -> tuple[int, int]:
+    """
+    Count parquet files under root and sum their sizes.
+
+    Walks with os.scandir so each file is stat'ed once and no Path objects
+    are created per entry. With sizes=False no file is stat'ed at all; the
+    directory entry type is enough to walk the tree. Returns (file_count, total_bytes).
+
+    The top of the tree is walked level by level; once a level is wide enough
+    (e.g. the day partitions of a long-running station) its subtrees are
+    walked in a small thread pool so cold-cache directory reads overlap.
+    """
+    count = 0
+    total = 0
+    level = [root]
+    while level and len(level) < _PARALLEL_MIN_DIRS:
+        next_level = []
+        for path in level:
+            c, t, subdirs = _scan_dir(path, sizes)
+            count += c
+            total += t
+            next_level.extend(subdirs)
+        level = next_level
+
+    if level:
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            for c, t in pool.map(functools.partial(_walk_parquet, sizes=sizes), level):
+                count += c
+                total += t
+    return count, total
+
+
+@app.command()
+def info():
+    """
+    Show configuration, sensors, and data statistics.
+
+    Displays station config, sensor status, and collected data info.
+    """
+    print_banner()
+
+    # Version info
+    console().print(f"Version: [green]{package_version()}[/green]\n")
+
+    # Configuration (each section is collected and rendered with a single print)
+    env_file = DEFAULT_ENV
+    lines = ["[bold]Configuration:[/bold]"]
+
+    # A missing or empty .env parses to {} and counts as not configured (as in setup)
+    if config := parse_env_file(env_file):
+        station_id = config.get("OPENSENSOR_STATION_ID", "Not set")
+        output_dir = config.get("OPENSENSOR_OUTPUT_DIR", "output")
+        sync_enabled = config.get("OPENSENSOR_SYNC_ENABLED", "false").lower() == "true"
+        health_enabled = config.get("OPENSENSOR_HEALTH_ENABLED", "true").lower() == "true"
+
+        lines.append(f"  Station ID: [cyan]{station_id}[/cyan]")
+        lines.append(f"  Output: [cyan]{output_dir}[/cyan]")
+        if sync_enabled:
+            provider = config.get("OPENSENSOR_STORAGE_PROVIDER", "s3")
+            bucket = config.get("OPENSENSOR_STORAGE_BUCKET", "")
+            lines.append(f"  Cloud sync: [cyan]Enabled ({provider}: {bucket})[/cyan]")
+        else:
+            lines.append("  Cloud sync: [cyan]Disabled[/cyan]")
+        lines.append(
+            f"  Health monitoring: [cyan]{'Enabled' if health_enabled else 'Disabled'}[/cyan]"
+        )
+        lines.append(f"  Config file: [dim]{env_file.absolute()}[/dim]")
+    else:
+        lines.append("  [yellow]Not configured[/yellow]")
+        lines.append("  Run: [cyan]opensensor setup[/cyan]")
+    console().print("\n".join(lines))
+
+    # Sensor status
+    lines = ["\n[bold]Sensors:[/bold]"]
+    sensors_status = check_sensor_availability()
+    lines.extend(f"  {sensor}: {status}" for sensor, status in sensors_status.items())
+    console().print("\n".join(lines))
+
+    # Data statistics
+    console().print("\n[bold]Data:[/bold]")
+    try:
+        output_dir = load_sensor_config().output_dir
+    except Exception:
+        output_dir = DEFAULT_OUTPUT
+
+    if output_dir.exists():
+        file_count, total_size = _scan_parquet(str(output_dir))
+        size_mb = total_size / (1024 * 1024)
+        console().print(f"  Parquet files: [green]{file_count}[/green]")
+        console().print(f"  Total size: [green]{size_mb:.2f} MB[/green]")
+        console().print(f"  Location: [dim]{output_dir.absolute()}[/dim]")
+    else:
+        console().print("  [dim]No data collected yet[/dim]")
+
+    # Health data
+    try:
+        health_dir = load_sensor_config().health_dir
+    except Exception:
+        health_dir = DEFAULT_HEALTH
+
+    if health_dir.exists():
+        health_count, _ = _scan_parquet(str(health_dir), sizes=False)
+        if health_count:
+            console().print(f"  Health files: [green]{health_count}[/green]")
+
+    # Service status (quick check)
+    console().print("\n[bold]Service:[/bold]")
+    try:
+        manager = service_manager()
+        if manager.is_installed():
+            snap = manager.snapshot()
+            if snap["ActiveState"] == "active":
+                console().print("  Status: [green]Running[/green]")
+            else:
+                console().print("  Status: [yellow]Stopped[/yellow]")
+            enabled = snap["UnitFileState"] == "enabled"
+            console().print(f"  Enabled: [cyan]{'Yes' if enabled else 'No'}[/cyan]")
+        else:
+            console().print("  [dim]Not installed[/dim]")
+            console().print("  Run: [cyan]opensensor service setup[/cyan]")
+    except Exception:
+        console().print("  [dim]Service check unavailable[/dim]")
+
+    console().print()
@@ -0,0 +1,167 @@
+"""Manage opensensor as a systemd service."""
+
+import typer
+
+from opensensor_enviroplus.cli.common import cli_error_handler, console, service_manager
+
+app = typer.Typer(
+    name="service",
+    help="Manage opensensor as a systemd service",
+    add_completion=False,
+    rich_markup_mode="rich",
+)
+
+
+@app.command("setup")
+@cli_error_handler
+def service_setup():
+    """
+    Quick setup: install + enable + start service.
+
+    One command to get the service running on boot.
+    """
+    console().print("\n[bold]Setting up opensensor service...[/bold]\n")
+
+    manager = service_manager()
+
+    # Install
+    console().print("1. Installing...")
+    console().print(f"   User: [cyan]{manager.user}[/cyan]")
+    console().print(f"   Path: [cyan]{manager.project_root}[/cyan]")
+    manager.install()
+
+    # Enable and start in one systemctl call
+    console().print("2. Enabling on boot and starting...")
+    manager.enable(now=True)
+
+    console().print("\n[bold green]Service running![/bold green]\n")
+    console().print("Commands:")
+    console().print("  [cyan]opensensor service status[/cyan]  - View status")
+    console().print("  [cyan]opensensor service logs[/cyan]    - View logs")
+    console().print("  [cyan]opensensor service stop[/cyan]    - Stop service\n")
+
+
+@app.command("status")
+@cli_error_handler
+def service_status():
+    """
+    Show service status and recent logs.
+    """
+    manager = service_manager()
+
+    if not manager.is_installed():
+        console().print("\n[yellow]Service not installed[/yellow]")
+        console().print("Run: [cyan]opensensor service setup[/cyan]\n")
+        return
+
+    # One systemctl call for both the active and enabled state
+    snap = manager.snapshot()
+
+    console().print("\n[bold]Service Status[/bold]\n")
+
+    # Status indicator
+    if snap["ActiveState"] == "active":
+        console().print("  Status: [green]RUNNING[/green]")
+    else:
+        console().print("  Status: [red]STOPPED[/red]")
+
+    enabled = snap["UnitFileState"] == "enabled"
+    console().print(f"  Enabled: [cyan]{'Yes' if enabled else 'No'}[/cyan]")
+
+    # Get detailed status
+    status_output, _ = manager.status()
+    console().print(f"\n[dim]{status_output}[/dim]")
+
+
+@app.command("logs")
+@cli_error_handler
+def service_logs(
+    follow: bool = typer.Option(False, "--follow", "-f", help="Follow log output"),
+    lines: int = typer.Option(50, "--lines", "-n", help="Number of lines"),
+):
+    """
+    View service logs from journalctl.
+    """
+    manager = service_manager()
+
+    if not manager.is_installed():
+        console().print("[yellow]Service not installed[/yellow]")
+        return
+
+    if follow:
+        console().print("[dim]Following logs... (Ctrl+C to stop)[/dim]\n")
+
+    manager.get_logs(lines=lines, follow=follow)
+
+
+@app.command("start")
+@cli_error_handler
+def service_start():
+    """Start the service."""
+    manager = service_manager()
+
+    if not manager.is_installed():
+        console().print("[red]Service not installed[/red]")
+        console().print("Run: [cyan]opensensor service setup[/cyan]\n")
+        raise typer.Exit(1)
+
+    manager.start()
+    console().print("[green]Service started[/green]\n")
+
+
+@app.command("stop")
+@cli_error_handler
+def service_stop():
+    """Stop the service."""
+    manager = service_manager()
+
+    if not manager.is_installed():
+        console().print("[yellow]Service not installed[/yellow]")
+        return
+
+    manager.stop()
+    console().print("[green]Service stopped[/green]\n")
+
+
+@app.command("restart")
+@cli_error_handler
+def service_restart():
+    """Restart the service."""
+    manager = service_manager()
+
+    if not manager.is_installed():
+        console().print("[red]Service not installed[/red]")
+        raise typer.Exit(1)
+
+    manager.restart()
+    console().print("[green]Service restarted[/green]\n")
+
+
+@app.command("remove")
+@cli_error_handler
+def service_remove():
+    """
+    Completely remove the service.
+
+    Stops, disables, and uninstalls the systemd service.
+    """
+    console().print("\n[bold]Removing opensensor service...[/bold]\n")
+
+    manager = service_manager()
+
+    if not manager.is_installed():
+        console().print("[yellow]Service not installed[/yellow]\n")
+        return
+
+    snap = manager.snapshot()
+
+    # Stop and disable in one systemctl call
+    if snap["ActiveState"] == "active" or snap["UnitFileState"] == "enabled":
+        console().print("1. Stopping and disabling...")
+        manager.disable(now=True)
+
+    # Uninstall
+    console().print("2. Removing...")
+    manager.uninstall()
+
+    console().print("\n[green]Service removed[/green]\n")
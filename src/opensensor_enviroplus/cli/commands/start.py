@@ -0,0 +1,97 @@
+"""Start the collector in the foreground."""
+
+import contextlib
+import importlib
+import threading
+
+import typer
+
+from opensensor_enviroplus.cli.common import (
+    check_sensor_availability,
+    cli_error_handler,
+    console,
+    load_app_config,
+    load_sensor_config,
+    load_storage_config,
+    print_banner,
+)
+
+app = typer.Typer(add_completion=False, rich_markup_mode="rich")
+
+
+def _prewarm_collector_imports() -> None:
+    """Import the collector stack (pyarrow, obstore, sensor drivers) ahead of use."""
+    # A failure here resurfaces, with a proper traceback, at the real import in start()
+    with contextlib.suppress(Exception):
+        importlib.import_module("opensensor_enviroplus.collector.polars_collector")
+
+
+@app.command()
+@cli_error_handler
+def start(
+    foreground: bool = typer.Option(False, "--foreground", help="Run in foreground (default)"),
+):
+    """
+    Start the sensor data collector (foreground).
+
+    Runs in foreground for debugging. For production, use:
+    opensensor service setup
+    """
+    # Overlap the slow collector imports with config loading and sensor probing
+    threading.Thread(target=_prewarm_collector_imports, daemon=True).start()
+
+    print_banner()
+    console().print("[bold]Starting data collector...[/bold]\n")
+
+    try:
+        from opensensor_enviroplus.config.settings import HealthStorageConfig
+        from opensensor_enviroplus.utils.logging import setup_logging
+
+        # Load configuration
+        sensor_config = load_sensor_config()
+        storage_config = load_storage_config()
+        # Use factory method to apply credential fallback from main config
+        health_storage_config = HealthStorageConfig.with_fallback(storage_config)
+        app_config = load_app_config()
+
+        # Create required directories
+        sensor_config.output_dir.mkdir(parents=True, exist_ok=True)
+        if sensor_config.health_enabled and sensor_config.health_dir:
+            sensor_config.health_dir.mkdir(parents=True, exist_ok=True)
+        app_config.log_dir.mkdir(parents=True, exist_ok=True)
+
+        # Check and display sensor availability at startup
+        sensors_status = check_sensor_availability()
+        lines = ["[bold]Sensors:[/bold]"]
+        lines.extend(f"  {sensor}: {status}" for sensor, status in sensors_status.items())
+        console().print("\n".join(lines), end="\n\n")
+
+        # Setup logging
+        log_file = app_config.log_dir / "opensensor.log"
+        logger = setup_logging(level=app_config.log_level, log_file=log_file)
+
+        from opensensor_enviroplus.collector.polars_collector import PolarsSensorCollector
+
+        # Create collector with auto-sync
+        collector = PolarsSensorCollector(
+            config=sensor_config,
+            logger=logger,
+            storage_config=storage_config,
+            health_storage_config=health_storage_config,
+        )
+
+        # Run collector
+        console().print(
+            f"Output: [cyan]{sensor_config.output_dir}[/cyan]\n"
+            f"Logs: [cyan]{log_file}[/cyan]\n"
+            "\n[dim]Press Ctrl+C to stop[/dim]\n"
+        )
+
+        collector.run()
+
+    except FileNotFoundError as e:
+        console().print("[red]ERROR: Configuration not found.[/red]")
+        console().print("Run [cyan]opensensor setup[/cyan] first.\n")
+        raise typer.Exit(1) from e
+    except KeyboardInterrupt:
+        console().print("\n[yellow]Stopped by user[/yellow]\n")
@@ -0,0 +1,59 @@
+"""Manual cloud sync."""
+
+from pathlib import Path
+
+import typer
+
+from opensensor_enviroplus.cli.common import (
+    cli_error_handler,
+    console,
+    load_app_config,
+    load_sensor_config,
+    load_storage_config,
+    print_banner,
+)
+
+app = typer.Typer(add_completion=False, rich_markup_mode="rich")
+
+
+@app.command()
+@cli_error_handler
+def sync(
+    directory: Path | None = typer.Option(None, help="Directory to sync"),
+):
+    """
+    Manually sync data to cloud storage.
+
+    Uploads local parquet files to configured cloud storage
+    (S3, R2, GCS, Azure, MinIO, Wasabi, Backblaze, Hetzner).
+    """
+    from opensensor_enviroplus.sync.obstore_sync import ObstoreSync
+    from opensensor_enviroplus.utils.logging import setup_logging
+
+    print_banner()
+    console().print("[bold]Syncing to cloud...[/bold]\n")
+
+    # Load configuration
+    sensor_config = load_sensor_config()
+    storage_config = load_storage_config()
+    app_config = load_app_config()
+
+    if not storage_config.sync_enabled:
+        console().print("[yellow]Cloud sync is not enabled.[/yellow]")
+        console().print("\nEnable in .env: [cyan]OPENSENSOR_SYNC_ENABLED=true[/cyan]\n")
+        raise typer.Exit(1)
+
+    # Setup logging
+    logger = setup_logging(level=app_config.log_level)
+
+    # Create sync client
+    sync_client = ObstoreSync(config=storage_config, logger=logger)
+
+    # Sync directory
+    sync_dir = directory or sensor_config.output_dir
+    files_synced = sync_client.sync_directory(sync_dir)
+
+    if files_synced > 0:
+        console().print(f"[green]Synced {files_synced} files[/green]\n")
+    else:
+        console().print("[dim]No new files to sync[/dim]\n")
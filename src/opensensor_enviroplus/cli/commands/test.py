@@ -0,0 +1,274 @@
+"""Test sensors with a live readings table."""
+
+import time
+
+import typer
+
+from opensensor_enviroplus.cli.common import console, load_sensor_config, print_banner
+
+app = typer.Typer(add_completion=False, rich_markup_mode="rich")
+
+
+@app.command()
+def test(
+    warmup: int = typer.Option(5, "--warmup", "-w", help="Warm-up time in seconds"),
+    readings: int = typer.Option(6, "--readings", "-r", help="Number of readings"),
+    interval: float = typer.Option(10.0, "--interval", "-i", help="Interval between readings"),
+):
+    """
+    Test sensors with live readings table.
+
+    Initializes sensors, warms up, then displays live readings.
+    """
+    from uuid import UUID
+
+    from pydantic import ValidationError
+    from rich.table import Table
+
+    from opensensor_enviroplus.config.settings import SensorConfig
+    from opensensor_enviroplus.utils.compensation import (
+        compensate_humidity,
+        compensate_temperature,
+        get_cpu_temperature,
+    )
+    from opensensor_enviroplus.utils.health import collect_health_metrics, health_to_dict
+
+    print_banner()
+    console().print("[bold]Testing Sensors[/bold]\n")
+
+    # Try to import sensor libraries
+    try:
+        import ads1015
+        import gpiod
+        import gpiodevice
+        from bme280 import BME280
+        from gpiod.line import Direction, Value
+        from ltr559 import LTR559
+        from pms5003 import PMS5003, ReadTimeoutError
+        from smbus2 import SMBus
+    except ImportError as e:
+        console().print("[red]ERROR: Sensor libraries not available[/red]")
+        console().print(f"[dim]{e}[/dim]")
+        console().print(
+            "\n[yellow]This command must run on a Raspberry Pi with sensors.[/yellow]\n"
+        )
+        raise typer.Exit(1) from e
+
+    # Constants for gas sensor
+    MICS6814_GAIN = 6.144
+    MICS6814_I2C_ADDR = 0x49
+
+    def voltage_to_resistance(voltage: float) -> float:
+        try:
+            return (voltage * 56000) / (3.3 - voltage)
+        except ZeroDivisionError:
+            return 0.0
+
+    # Initialize sensors and build status table
+    sensors_table = Table(title="Sensor Status", show_header=True)
+    sensors_table.add_column("Sensor", style="cyan")
+    sensors_table.add_column("Status")
+    sensors_table.add_column("Description", style="dim")
+
+    # BME280
+    bme280 = None
+    try:
+        bme280 = BME280(i2c_dev=SMBus(1))
+        sensors_table.add_row("BME280", "[green]OK[/green]", "Temperature, Humidity, Pressure")
+    except Exception as e:
+        sensors_table.add_row("BME280", "[red]FAIL[/red]", str(e)[:40])
+
+    # Gas sensor (ADS1015/ADS1115)
+    gas_adc = None
+    try:
+        ads1015.I2C_ADDRESS_DEFAULT = MICS6814_I2C_ADDR
+        gas_adc = ads1015.ADS1015(i2c_addr=MICS6814_I2C_ADDR)
+        adc_type = gas_adc.detect_chip_type()
+        gas_adc.set_mode("single")
+        gas_adc.set_programmable_gain(MICS6814_GAIN)
+        if adc_type == "ADS1115":
+            gas_adc.set_sample_rate(128)
+        else:
+            gas_adc.set_sample_rate(1600)
+        # Enable heater
+        outh = gpiod.LineSettings(direction=Direction.OUTPUT, output_value=Value.ACTIVE)
+        gpiodevice.get_pin("GPIO24", "EnviroPlus", outh)
+        sensors_table.add_row(
+            "MICS6814", f"[green]OK[/green] ({adc_type})", "Gas sensor (Ox, Red, NH3)"
+        )
+    except Exception as e:
+        sensors_table.add_row("MICS6814", "[red]FAIL[/red]", str(e)[:40])
+
+    # LTR559
+    ltr559 = None
+    try:
+        ltr559 = LTR559()
+        sensors_table.add_row("LTR559", "[green]OK[/green]", "Light and Proximity")
+    except Exception as e:
+        sensors_table.add_row("LTR559", "[red]FAIL[/red]", str(e)[:40])
+
+    # PMS5003
+    pms5003 = None
+    try:
+        # Load config to get device path
+        try:
+            config = load_sensor_config()
+        except ValidationError:
+            # Fallback for "on the fly" testing without setup
+            console().print(
+                "[yellow]WARNING: No configuration found. Running in temporary test mode.[/yellow]"
+            )
+            console().print("Run [cyan]opensensor setup[/cyan] to save settings permanently.\n")
+            config = SensorConfig(station_id=UUID(int=0))
+
+        pms5003 = PMS5003(device=config.pms5003_device)
+        sensors_table.add_row(
+            "PMS5003",
+            f"[green]OK[/green] ({config.pms5003_device})",
+            "Particulate Matter (PM1, PM2.5, PM10)",
+        )
+    except Exception as e:
+        sensors_table.add_row("PMS5003", "[red]FAIL[/red]", str(e)[:40])
+
+    console().print(sensors_table)
+
+    # Check if any sensors available
+    if not any([bme280, gas_adc, ltr559, pms5003]):
+        console().print("\n[red]ERROR: No sensors initialized.[/red]")
+        console().print("[dim]Check I2C/SPI interfaces: sudo raspi-config[/dim]\n")
+        raise typer.Exit(1)
+
+    # Warm-up countdown
+    console().print(f"\n[yellow]Warming up ({warmup}s)...[/yellow]", end="")
+    for i in range(warmup, 0, -1):
+        console().print(f" {i}", end="", style="dim")
+        time.sleep(1)
+    console().print(" [green]Ready![/green]\n")
+
+    # Take readings
+    console().print(f"[bold]Taking {readings} readings (every {interval}s):[/bold]\n")
+
+    all_readings = []
+
+    for reading_num in range(1, readings + 1):
+        reading = {"#": reading_num}
+
+        # BME280 readings
+        if bme280:
+            try:
+                raw_temp = bme280.get_temperature()
+                raw_hum = bme280.get_humidity()
+
+                # Apply compensation
+                cpu_temp = get_cpu_temperature()
+                comp_temp = compensate_temperature(
+                    raw_temp,
+                    cpu_temp,
+                    config.temp_compensation_factor if config.temp_compensation_enabled else 1.0,
+                )
+
+                if config.temp_compensation_enabled:
+                    comp_hum = compensate_humidity(raw_hum, raw_temp, comp_temp)
+                    reading["Temp °C"] = f"{comp_temp:.1f} (raw: {raw_temp:.1f})"
+                    reading["Hum %"] = f"{comp_hum:.1f} (raw: {raw_hum:.1f})"
+                else:
+                    reading["Temp °C"] = f"{raw_temp:.1f}"
+                    reading["Hum %"] = f"{raw_hum:.1f}"
+
+                reading["hPa"] = f"{bme280.get_pressure():.0f}"
+            except Exception:
+                reading["Temp °C"] = "-"
+                reading["Hum %"] = "-"
+                reading["hPa"] = "-"
+
+        # Gas sensor readings
+        if gas_adc:
+            try:
+                ox = gas_adc.get_voltage("in0/gnd")
+                red = gas_adc.get_voltage("in1/gnd")
+                nh3 = gas_adc.get_voltage("in2/gnd")
+                reading["Ox kΩ"] = f"{voltage_to_resistance(ox) / 1000:.1f}"
+                reading["Red kΩ"] = f"{voltage_to_resistance(red) / 1000:.1f}"
+                reading["NH3 kΩ"] = f"{voltage_to_resistance(nh3) / 1000:.1f}"
+            except Exception:
+                reading["Ox kΩ"] = "-"
+                reading["Red kΩ"] = "-"
+                reading["NH3 kΩ"] = "-"
+
+        # Light sensor readings
+        if ltr559:
+            try:
+                reading["Lux"] = f"{ltr559.get_lux():.0f}"
+                reading["Prox"] = f"{ltr559.get_proximity()}"
+            except Exception:
+                reading["Lux"] = "-"
+                reading["Prox"] = "-"
+
+        # Particulate sensor readings
+        if pms5003:
+            try:
+                pm = pms5003.read()
+                reading["PM1"] = f"{pm.pm_ug_per_m3(1.0)}"
+                reading["PM2.5"] = f"{pm.pm_ug_per_m3(2.5)}"
+                reading["PM10"] = f"{pm.pm_ug_per_m3(10)}"
+            except ReadTimeoutError:
+                reading["PM1"] = "..."
+                reading["PM2.5"] = "..."
+                reading["PM10"] = "..."
+            except Exception:
+                reading["PM1"] = "-"
+                reading["PM2.5"] = "-"
+                reading["PM10"] = "-"
+
+        all_readings.append(reading)
+
+        # Build and display table
+        table = Table(title=f"Readings ({reading_num}/{readings})")
+
+        # Add columns based on what sensors we have
+        if all_readings:
+            for col in all_readings[0]:
+                table.add_column(col, justify="right" if col != "#" else "center")
+
+            for r in all_readings:
+                table.add_row(*[str(v) for v in r.values()])
+
+        console().print(table)
+
+        if reading_num < readings:
+            time.sleep(interval)
+            console().print()
+
+            console().print()
+
+    # Health Metrics Section
+    console().print("\n[bold]System Health[/bold]\n")
+
+    try:
+        health_metrics = collect_health_metrics()
+        health_data = health_to_dict(health_metrics)
+
+        # Filter available vs unavailable
+        available = {k: v for k, v in health_data.items() if v is not None}
+        unavailable = [k for k, v in health_data.items() if v is None]
+
+        if available:
+            health_table = Table(show_header=True, header_style="bold magenta")
+            health_table.add_column("Metric")
+            health_table.add_column("Value")
+
+            for key, value in available.items():
+                health_table.add_row(key, str(value))
+
+            console().print(health_table)
+
+        if unavailable:
+            console().print("\n[yellow]Unavailable Metrics:[/yellow]")
+            for key in unavailable:
+                console().print(f"  - {key}")
+
+    except Exception as e:
+        console().print(f"[red]Error collecting health metrics: {e}[/red]")
+
+    console().print("\n[bold green]Test complete![/bold green]")
+    console().print("\nNext: [cyan]opensensor service setup[/cyan] for continuous collection\n")
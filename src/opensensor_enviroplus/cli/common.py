@@ -0,0 +1,222 @@
+"""
+Shared helpers for the CLI command modules.
+
+Kept free of heavy imports so that loading a single command stays cheap.
+"""
+
+import functools
+import os
+import re
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import typer
+
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.text import Text
+
+    from opensensor_enviroplus.config.settings import AppConfig, SensorConfig, StorageConfig
+    from opensensor_enviroplus.service.manager import ServiceManager
+
+# Shell completion (TAB) runs the CLI with one of these set; keep it output-free
+COMPLETING = any(
+    k.startswith("_OPENSENSOR_COMPLETE") or k == "_TYPER_COMPLETE_ARGS" for k in os.environ
+)
+
+# Rich markup tags such as [bold], [/red] or [dim cyan] (Rich's own opening-character rule)
+_MARKUP_TAG_RE = re.compile(r"\[[a-z#/@][^\[\]]*\]")
+
+# Default locations, relative to the working directory
+DEFAULT_ENV = Path(".env")
+DEFAULT_OUTPUT = Path("output")
+DEFAULT_HEALTH = Path("output-health")
+
+
+class _PlainConsole:
+    """
+    Stand-in for the Rich console when stdout is not a terminal.
+
+    Plain strings and styled text are written with print() and markup tags
+    stripped; anything else (tables) is handed to a real Rich console. Output
+    is flushed per call like Rich does, since under systemd stdout is a pipe.
+    """
+
+    def print(self, *objects, sep: str = " ", end: str = "\n", markup: bool = True, **kwargs):
+        parts = []
+        for obj in objects:
+            if isinstance(obj, str):
+                parts.append(_MARKUP_TAG_RE.sub("", obj) if markup else obj)
+            elif isinstance(getattr(obj, "plain", None), str):
+                parts.append(obj.plain)
+            else:
+                _rich_console().print(*objects, sep=sep, end=end, markup=markup, **kwargs)
+                return
+        print(*parts, sep=sep, end=end, flush=True)
+
+
+@functools.cache
+def _rich_console() -> "Console":
+    """Shared Rich console, created (and Rich imported) on first use."""
+    from rich.console import Console
+
+    return Console()
+
+
+@functools.cache
+def console() -> "Console | _PlainConsole":
+    """Console for CLI output; skips Rich entirely when stdout is not a terminal."""
+    if not sys.stdout.isatty():
+        return _PlainConsole()
+    return _rich_console()
+
+
+@functools.cache
+def load_sensor_config() -> "SensorConfig":
+    """SensorConfig from the environment and .env, built once per process."""
+    from opensensor_enviroplus.config.settings import SensorConfig
+
+    return SensorConfig()
+
+
+@functools.cache
+def load_storage_config() -> "StorageConfig":
+    """StorageConfig from the environment and .env, built once per process."""
+    from opensensor_enviroplus.config.settings import StorageConfig
+
+    return StorageConfig()
+
+
+@functools.cache
+def load_app_config() -> "AppConfig":
+    """AppConfig from the environment and .env, built once per process."""
+    from opensensor_enviroplus.config.settings import AppConfig
+
+    return AppConfig()
+
+
+@functools.cache
+def _banner_text() -> "Text":
+    """Build the banner once; later prints reuse the parsed segments."""
+    from rich.text import Text
+
+    text = Text()
+    text.append("\nOpenSensor.Space", style="bold cyan")
+    text.append(" | Enviro+ Data Collector\n")
+    text.append("A walkthru.earth Initiative\n", style="dim")
+    return text
+
+
+def print_banner():
+    """Print opensensor.space branded banner."""
+    if COMPLETING:
+        return
+    console().print(_banner_text())
+
+
+def cli_error_handler(func):
+    """Report uncaught command errors as a red ERROR line and exit with code 1."""
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        except typer.Exit:
+            raise
+        except Exception as e:
+            console().print(f"[red]ERROR: {e}[/red]")
+            raise typer.Exit(1) from e
+
+    return wrapper
+
+
+def check_sensor_availability() -> dict[str, str]:
+    """
+    Check which sensors are available and return their status.
+    Returns a dict mapping sensor name to status string (with Rich markup).
+    """
+    sensors_status = {}
+
+    # Try to import sensor libraries
+    try:
+        import ads1015
+        import gpiod
+        import gpiodevice
+        from bme280 import BME280
+        from gpiod.line import Direction, Value
+        from ltr559 import LTR559
+        from pms5003 import PMS5003
+        from smbus2 import SMBus
+    except ImportError:
+        return {
+            "BME280": "[yellow]N/A[/yellow] (not on Pi)",
+            "MICS6814": "[yellow]N/A[/yellow] (not on Pi)",
+            "LTR559": "[yellow]N/A[/yellow] (not on Pi)",
+            "PMS5003": "[yellow]N/A[/yellow] (not on Pi)",
+        }
+
+    # Constants for gas sensor
+    MICS6814_GAIN = 6.144
+    MICS6814_I2C_ADDR = 0x49
+
+    # BME280
+    try:
+        BME280(i2c_dev=SMBus(1))
+        sensors_status["BME280"] = "[green]OK[/green]"
+    except Exception as e:
+        sensors_status["BME280"] = f"[red]FAIL[/red] ({e})"
+
+    # Gas sensor (ADS1015/ADS1115)
+    try:
+        ads1015.I2C_ADDRESS_DEFAULT = MICS6814_I2C_ADDR
+        gas_adc = ads1015.ADS1015(i2c_addr=MICS6814_I2C_ADDR)
+        adc_type = gas_adc.detect_chip_type()
+        gas_adc.set_mode("single")
+        gas_adc.set_programmable_gain(MICS6814_GAIN)
+        if adc_type == "ADS1115":
+            gas_adc.set_sample_rate(128)
+        else:
+            gas_adc.set_sample_rate(1600)
+        # Enable heater
+        outh = gpiod.LineSettings(direction=Direction.OUTPUT, output_value=Value.ACTIVE)
+        gpiodevice.get_pin("GPIO24", "EnviroPlus", outh)
+        sensors_status["MICS6814"] = f"[green]OK[/green] ({adc_type})"
+    except Exception as e:
+        sensors_status["MICS6814"] = f"[red]FAIL[/red] ({e})"
+
+    # LTR559
+    try:
+        LTR559()
+        sensors_status["LTR559"] = "[green]OK[/green]"
+    except Exception as e:
+        sensors_status["LTR559"] = f"[red]FAIL[/red] ({e})"
+
+    # PMS5003
+    try:
+        from uuid import UUID
+
+        from pydantic import ValidationError
+
+        from opensensor_enviroplus.config.settings import SensorConfig
+
+        # Load config to get device path
+        try:
+            config = load_sensor_config()
+        except ValidationError:
+            # Fallback for "on the fly" testing without setup
+            config = SensorConfig(station_id=UUID(int=0))
+
+        PMS5003(device=config.pms5003_device)
+        sensors_status["PMS5003"] = f"[green]OK[/green] ({config.pms5003_device})"
+    except Exception as e:
+        sensors_status["PMS5003"] = f"[red]FAIL[/red] ({e})"
+
+    return sensors_status
+
+
+def service_manager() -> "ServiceManager":
+    """Create a ServiceManager, importing the service module on first use."""
+    from opensensor_enviroplus.service.manager import ServiceManager
+
+    return ServiceManager()
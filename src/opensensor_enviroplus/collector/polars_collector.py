@@ -1,19 +1,25 @@
 """
-Modern sensor data collector using Polars and Apache Arrow.
-Memory-efficient streaming with Delta Lake for append-capable storage.
+Modern sensor data collector using Apache Arrow.
+Memory-efficient batches written as Hive-partitioned Parquet.
 """
 
 import logging
+import os
 import time
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from pathlib import Path
 from typing import Any
 
-import polars as pl
 import pyarrow as pa
+import pyarrow.parquet as pq
 
 from opensensor_enviroplus.config.settings import SensorConfig, StorageConfig
 from opensensor_enviroplus.sync.obstore_sync import ObstoreSync
 from opensensor_enviroplus.utils.compensation import (
+    CPU_TEMP_PATH,
     compensate_humidity,
     compensate_temperature,
     get_cpu_temperature,
@@ -45,15 +51,35 @@ except ImportError:
 MICS6814_GAIN = 6.144
 MICS6814_I2C_ADDR = 0x49
 MICS6814_HEATER_PIN = "GPIO24"
+# ADS1015 inputs for the oxidising, reducing and NH3 channels (GAS_COLUMNS order)
+MICS6814_CHANNELS = ("in0/gnd", "in1/gnd", "in2/gnd")
+
+# Fields written by each sensor, in column order
+BME280_COLUMNS = ("temperature", "raw_temperature", "pressure", "humidity", "raw_humidity")
+GAS_COLUMNS = ("oxidised", "reducing", "nh3")
+LTR559_COLUMNS = ("lux", "proximity")
+PMS5003_COLUMNS = (
+    "pm1",
+    "pm25",
+    "pm10",
+    "particles_03um",
+    "particles_05um",
+    "particles_10um",
+    "particles_25um",
+    "particles_50um",
+    "particles_100um",
+)
+
+# Sensor fields stored as Float32 in the Parquet output
+FLOAT_COLUMNS = BME280_COLUMNS + GAS_COLUMNS + LTR559_COLUMNS + PMS5003_COLUMNS
 
 
 class PolarsSensorCollector:
     """
-    Production-ready sensor collector using Polars streaming.
+    Production-ready sensor collector writing Hive-partitioned Parquet.
 
     Features:
     - Memory-efficient batch collection
-    - Delta Lake for append-capable storage
     - Apache Arrow for zero-copy operations
     - Graceful sensor error handling
     - Smart logging for debugging
@@ -68,12 +94,27 @@ class PolarsSensorCollector:
     ):
         self.config = config
         self.logger = logger
-        self.buffer: list[dict[str, Any]] = []
+        self.buffer_rows = 0
+        # Flush early if a batch grows past twice its expected size, so the buffer
+        # (and the file it becomes) stays bounded even if the timing goes wrong
+        self.max_buffer_rows = 2 * (config.batch_duration // config.read_interval)
         self.health_buffer: list[dict[str, Any]] = []  # System health metrics
 
-        # Calculate next clock-aligned batch boundary (00, 15, 30, 45 minutes)
+        # Station partition directories (sensor and health data) and, per station
+        # directory, the current day's partition under it (see _day_partition)
+        station = f"station={self.config.station_id}"
+        self._station_dir = self.config.output_dir / station
+        self._health_station_dir = self.config.health_dir / station
+        self._day_partitions: dict[Path, tuple[tuple[int, int, int], Path]] = {}
+
+        # Calculate next clock-aligned batch boundary (00, 15, 30, 45 minutes).
+        # The *_deadline values are the same boundaries on the time.monotonic() clock,
+        # so the per-tick checks don't have to build a datetime.
         self.next_batch_time = self._calculate_next_batch_boundary()
-        self.cpu_temps: list[float] = []
+        self.next_batch_deadline = self._monotonic_deadline(self.next_batch_time)
+        # Rolling window of the last 5 CPU temperatures for compensation smoothing
+        self.cpu_temps: deque[float] = deque(maxlen=5)
+        self._cpu_temp_fd: int | None = None  # opened on first read, -1 if unavailable
 
         # Sensor warm-up tracking
         self.readings_count = 0
@@ -113,36 +154,27 @@ class PolarsSensorCollector:
                 interval = health_storage_config.sync_interval_minutes
 
             self.next_sync_time = self._calculate_next_sync_boundary(interval)
+            self.next_sync_deadline = self._monotonic_deadline(self.next_sync_time)
         else:
             self.next_sync_time = None
+            self.next_sync_deadline = None
 
-        # Initialize sensors
+        # Scheduled syncs run on their own thread so uploads don't delay sensor reads
+        self._sync_executor: ThreadPoolExecutor | None = None
+        self._sync_future: Future[None] | None = None
+
+        # Initialize sensors and the per-reading read steps for the ones that are present
         self._init_sensors()
+        self._build_sensor_readers()
+        # Column-oriented batch buffer: one list per reading-template field
+        self.buffer = self._new_buffer()
 
-        # Arrow schema for type safety and efficiency
+        # Arrow schema for type safety and efficiency; batches are built with these types.
+        # station_id is not a column: it only lives in the Hive partition path.
         self.schema = pa.schema(
             [
                 ("timestamp", pa.timestamp("ms", tz="UTC")),
-                ("station_id", pa.string()),
-                ("temperature", pa.float32()),
-                ("raw_temperature", pa.float32()),
-                ("pressure", pa.float32()),
-                ("humidity", pa.float32()),
-                ("raw_humidity", pa.float32()),
-                ("oxidised", pa.float32()),
-                ("reducing", pa.float32()),
-                ("nh3", pa.float32()),
-                ("lux", pa.float32()),
-                ("proximity", pa.float32()),
-                ("pm1", pa.float32()),
-                ("pm25", pa.float32()),
-                ("pm10", pa.float32()),
-                ("particles_03um", pa.float32()),
-                ("particles_05um", pa.float32()),
-                ("particles_10um", pa.float32()),
-                ("particles_25um", pa.float32()),
-                ("particles_50um", pa.float32()),
-                ("particles_100um", pa.float32()),
+                *((name, pa.float32()) for name in FLOAT_COLUMNS),
             ]
         )
 
@@ -207,24 +239,49 @@ class PolarsSensorCollector:
             self.pms5003 = None
 
     def _get_cpu_temperature(self) -> float:
-        """Get CPU temperature for compensation."""
+        """
+        Get CPU temperature for compensation.
+
+        The sysfs file is opened once and re-read at offset 0 with a single pread
+        per reading, instead of open/read/close every time.
+        """
+        fd = self._cpu_temp_fd
+        if fd is None:
+            try:
+                fd = os.open(CPU_TEMP_PATH, os.O_RDONLY)
+            except OSError:
+                fd = -1
+            self._cpu_temp_fd = fd
+
+        if fd >= 0:
+            try:
+                return float(os.pread(fd, 16, 0)) / 1000.0
+            except (OSError, ValueError):
+                pass
+        # Not on a Pi, or the read failed: use the shared helper and its default
         return get_cpu_temperature()
 
+    def close(self) -> None:
+        """Release file handles held open between readings."""
+        if self._cpu_temp_fd is not None and self._cpu_temp_fd >= 0:
+            os.close(self._cpu_temp_fd)
+        self._cpu_temp_fd = None
+
     @staticmethod
-    def _voltage_to_resistance(voltage: float) -> float:
+    def _voltage_to_kohms(voltage: float) -> float:
         """
         Convert ADC voltage to resistance for MICS6814 gas sensor.
 
         The MICS6814 is a resistive sensor. This formula converts the voltage
-        reading from the ADS1015 ADC to resistance in Ohms.
+        reading from the ADS1015 ADC to resistance in kOhms.
 
-        Formula: R = (V * 56000) / (3.3 - V)
+        Formula: R = (V * 56000) / (3.3 - V) Ohms = (V * 56) / (3.3 - V) kOhms
         Where 56000 is the load resistor value and 3.3V is the reference voltage.
+        Readings at (or above) the reference voltage have no meaningful resistance
+        and return 0.0 instead of inf or a negative value.
         """
-        try:
-            return (voltage * 56000) / (3.3 - voltage)
-        except ZeroDivisionError:
-            return 0.0
+        headroom = 3.3 - voltage
+        return (voltage * 56.0) / headroom if headroom > 1e-6 else 0.0
 
     def _compensate_temperature(self, raw_temp: float) -> float:
         """Compensate temperature for CPU heat."""
@@ -234,9 +291,9 @@ class PolarsSensorCollector:
         cpu_temp = self._get_cpu_temperature()
 
         if not self.cpu_temps:
-            self.cpu_temps = [cpu_temp] * 5
+            self.cpu_temps.extend([cpu_temp] * 5)
         else:
-            self.cpu_temps = self.cpu_temps[1:] + [cpu_temp]
+            self.cpu_temps.append(cpu_temp)  # maxlen drops the oldest
 
         avg_cpu_temp = sum(self.cpu_temps) / len(self.cpu_temps)
         return compensate_temperature(
@@ -266,82 +323,104 @@ class PolarsSensorCollector:
         # Use shared utility
         return compensate_humidity(raw_humidity, raw_temp, compensated_temp)
 
-    def read_sensors(self) -> dict[str, Any]:
-        """Read from all available sensors."""
-        data: dict[str, Any] = {
-            "timestamp": datetime.now(timezone.utc),
-            "station_id": str(self.config.station_id),
-        }
+    def _build_sensor_readers(self) -> None:
+        """
+        Prepare the read steps and the reading template for the sensors present.
 
-        # BME280: temperature, pressure, humidity
-        if self.bme280:
-            try:
-                raw_temp = self.bme280.get_temperature()
-                raw_humidity = self.bme280.get_humidity()
-                compensated_temp = self._compensate_temperature(raw_temp)
-
-                data["temperature"] = compensated_temp
-                data["raw_temperature"] = raw_temp
-                data["pressure"] = self.bme280.get_pressure()
-                data["humidity"] = self._compensate_humidity(
-                    raw_humidity, raw_temp, compensated_temp
-                )
-                data["raw_humidity"] = raw_humidity
-            except Exception as e:
-                log_error(e, self.logger, "BME280 read error")
-
-        # MICS6814 gas sensor via ADS1015 ADC
-        if self.gas_adc:
-            try:
-                ox = self.gas_adc.get_voltage("in0/gnd")
-                red = self.gas_adc.get_voltage("in1/gnd")
-                nh3 = self.gas_adc.get_voltage("in2/gnd")
-
-                # Convert voltage to resistance (kOhms)
-                data["oxidised"] = self._voltage_to_resistance(ox) / 1000.0
-                data["reducing"] = self._voltage_to_resistance(red) / 1000.0
-                data["nh3"] = self._voltage_to_resistance(nh3) / 1000.0
-            except Exception as e:
-                log_error(e, self.logger, "Gas sensor read error")
-
-        # LTR559: light sensor
-        if self.ltr559:
-            try:
-                data["lux"] = self.ltr559.get_lux()
-                data["proximity"] = self.ltr559.get_proximity()
-            except Exception as e:
-                log_error(e, self.logger, "LTR559 read error")
+        Availability is fixed after _init_sensors, so read_sensors just runs the
+        read steps in column order on a copy of the template instead of
+        re-checking each sensor and building a new dict on every reading.
+        """
+        sensors: list[tuple[Any, Callable[[dict[str, Any]], None], tuple[str, ...]]] = [
+            (self.bme280, self._read_bme280, BME280_COLUMNS),
+            (self.gas_adc, self._read_gas, GAS_COLUMNS),
+            (self.ltr559, self._read_ltr559, LTR559_COLUMNS),
+            (self.pms5003, self._read_pms5003, PMS5003_COLUMNS),
+        ]
+        self._sensor_readers = [read for sensor, read, _ in sensors if sensor]
+        self._reading_template: dict[str, Any] = {"timestamp": None}
+        for sensor, _, columns in sensors:
+            if sensor:
+                self._reading_template.update(dict.fromkeys(columns))
+
+    def _new_buffer(self) -> dict[str, list[Any]]:
+        """Empty column buffer with one list per field of the reading template."""
+        return {name: [] for name in self._reading_template}
+
+    def _read_bme280(self, data: dict[str, Any]) -> None:
+        """BME280: temperature, pressure, humidity (compensated in read_sensors)."""
+        try:
+            raw_temp = self.bme280.get_temperature()
+            raw_humidity = self.bme280.get_humidity()
+            pressure = self.bme280.get_pressure()
+        except Exception as e:
+            log_error(e, self.logger, "BME280 read error")
+            return
 
-        # PMS5003: particulate matter
-        if self.pms5003:
-            try:
-                pm = self.pms5003.read()
-                data["pm1"] = float(pm.pm_ug_per_m3(1.0))
-                data["pm25"] = float(pm.pm_ug_per_m3(2.5))
-                data["pm10"] = float(pm.pm_ug_per_m3(10.0))
-                data["particles_03um"] = float(pm.pm_per_1l_air(0.3))
-                data["particles_05um"] = float(pm.pm_per_1l_air(0.5))
-                data["particles_10um"] = float(pm.pm_per_1l_air(1.0))
-                data["particles_25um"] = float(pm.pm_per_1l_air(2.5))
-                data["particles_50um"] = float(pm.pm_per_1l_air(5.0))
-                data["particles_100um"] = float(pm.pm_per_1l_air(10.0))
-            except (ReadTimeoutError, ValueError) as e:
-                log_error(e, self.logger, "PMS5003 read error")
-                # Set PM fields to None on error
-                for field in [
-                    "pm1",
-                    "pm25",
-                    "pm10",
-                    "particles_03um",
-                    "particles_05um",
-                    "particles_10um",
-                    "particles_25um",
-                    "particles_50um",
-                    "particles_100um",
-                ]:
-                    data.setdefault(field, None)
-
-        log_sensor_reading(data, self.logger)
+        data["temperature"] = raw_temp
+        data["raw_temperature"] = raw_temp
+        data["pressure"] = pressure
+        data["humidity"] = raw_humidity
+        data["raw_humidity"] = raw_humidity
+
+    def _read_gas(self, data: dict[str, Any]) -> None:
+        """MICS6814 gas sensor via ADS1015 ADC."""
+        try:
+            # Convert voltage to resistance (kOhms); all three channels are read
+            # before any value is stored
+            data["oxidised"], data["reducing"], data["nh3"] = (
+                self._voltage_to_kohms(self.gas_adc.get_voltage(channel))
+                for channel in MICS6814_CHANNELS
+            )
+        except Exception as e:
+            log_error(e, self.logger, "Gas sensor read error")
+
+    def _read_ltr559(self, data: dict[str, Any]) -> None:
+        """LTR559: light and proximity."""
+        try:
+            data["lux"] = self.ltr559.get_lux()
+            data["proximity"] = self.ltr559.get_proximity()
+        except Exception as e:
+            log_error(e, self.logger, "LTR559 read error")
+
+    def _read_pms5003(self, data: dict[str, Any]) -> None:
+        """PMS5003: particulate matter."""
+        try:
+            frame = self.pms5003.read().data
+            # Decoded frame words: [0:3] PM1/PM2.5/PM10 ug/m3 (standard particle),
+            # [3:6] the same in atmospheric environment, [6:12] particle counts
+            # >0.3/0.5/1.0/2.5/5.0/10um per 0.1L. Ints are stored as-is and cast to
+            # Float32 when the batch is converted to Arrow.
+            data.update(zip(PMS5003_COLUMNS, frame[0:3] + frame[6:12], strict=True))
+        except (ReadTimeoutError, ValueError) as e:
+            # PM fields stay None from the reading template
+            log_error(e, self.logger, "PMS5003 read error")
+
+    def read_sensors(self, compensate: bool = True) -> dict[str, Any]:
+        """
+        Read from all available sensors.
+
+        With compensate=False the raw BME280 values are reported uncompensated
+        and the CPU temperature is not read (used for discarded warm-up readings).
+        """
+        data = self._reading_template.copy()
+        data["timestamp"] = datetime.now(timezone.utc)
+
+        for read in self._sensor_readers:
+            read(data)
+
+        # Replace the raw BME280 values in place (keeps column order) with the
+        # CPU-heat compensated ones
+        if compensate and data.get("raw_temperature") is not None:
+            raw_temp = data["raw_temperature"]
+            compensated_temp = self._compensate_temperature(raw_temp)
+            data["temperature"] = compensated_temp
+            data["humidity"] = self._compensate_humidity(
+                data["raw_humidity"], raw_temp, compensated_temp
+            )
+
+        if self.logger.isEnabledFor(logging.DEBUG):
+            log_sensor_reading(data, self.logger)
         return data
 
     def _calculate_next_batch_boundary(self) -> datetime:
@@ -390,40 +469,61 @@ class PolarsSensorCollector:
 
         return next_boundary
 
+    @staticmethod
+    def _monotonic_deadline(boundary: datetime) -> float:
+        """Convert a wall-clock boundary into a time.monotonic() deadline."""
+        return time.monotonic() + (boundary - datetime.now(timezone.utc)).total_seconds()
+
     def collect_reading(self) -> None:
         """Collect a sensor reading and buffer it."""
-        reading = self.read_sensors()
         self.readings_count += 1
 
-        # Skip initial readings during sensor warm-up period
+        # Skip initial readings during sensor warm-up period. The hardware is still
+        # read (the PMS5003 serial stream must keep draining), but compensation isn't.
         if self.readings_count <= self.warmup_readings:
+            self.read_sensors(compensate=False)
             self.logger.debug(
                 f"Skipping warm-up reading {self.readings_count}/{self.warmup_readings}"
             )
             return
 
-        self.buffer.append(reading)
+        reading = self.read_sensors()
+
+        self._buffer_reading(reading)
 
         # Collect health metrics periodically (less frequent than sensor data)
         if self.config.health_enabled and self.readings_count % self.health_interval == 0:
             self._collect_health()
 
+    def _buffer_reading(self, reading: dict[str, Any]) -> None:
+        """
+        Append a reading to the column buffer.
+
+        Every reading is a copy of the reading template, so it has exactly the
+        buffer's fields (None for failed reads) and each value is appended as is.
+        """
+        buffer = self.buffer
+        for name, value in reading.items():
+            buffer[name].append(value)
+        self.buffer_rows += 1
+
     def should_flush(self) -> bool:
         """
         Check if it's time to flush the batch.
 
         Uses clock-aligned boundaries (00, 15, 30, 45 minutes) instead of elapsed time.
-        This ensures consistent batch times across all sensors.
+        This ensures consistent batch times across all sensors. A full buffer
+        (max_buffer_rows) also triggers a flush.
         """
-        return datetime.now(timezone.utc) >= self.next_batch_time
+        return (
+            time.monotonic() >= self.next_batch_deadline or self.buffer_rows >= self.max_buffer_rows
+        )
 
     def _collect_health(self) -> None:
         """Collect system health metrics."""
         try:
             health = collect_health_metrics()
-            health_data = health_to_dict(health)
-            health_data["station_id"] = str(self.config.station_id)
-            self.health_buffer.append(health_data)
+            self.health_buffer.append(health_to_dict(health))
             self.logger.debug(
                 f"Health: CPU={health.cpu_temp_c:.1f}°C, "
                 f"Mem={health.memory_percent_used:.0f}%, "
@@ -433,31 +533,37 @@ class PolarsSensorCollector:
             log_error(e, self.logger, "Health collection error")
 
     def flush_batch(self) -> None:
-        """Write buffered readings using Polars and Delta Lake."""
-        if not self.buffer:
+        """Write buffered readings as a Hive-partitioned Parquet file."""
+        if not self.buffer_rows:
             self.logger.warning("WARNING:  No data to flush")
             return
 
         start_time = time.time()
-        count = len(self.buffer)
+        count = self.buffer_rows
 
         try:
-            # Create Polars DataFrame from buffer
-            df = pl.DataFrame(self.buffer)
-
-            # Optimize data types and ensure proper timestamp format
-            df = self._optimize_dtypes(df)
+            # Convert the buffered columns straight to typed Arrow arrays (Float32,
+            # ms-precision UTC timestamps)
+            batch = pa.RecordBatch.from_arrays(
+                [
+                    pa.array(values, type=self.schema.field(name).type)
+                    for name, values in self.buffer.items()
+                ],
+                names=list(self.buffer),
+            )
 
             # Write Hive-partitioned Parquet
-            self._write_parquet_partitioned(df)
+            self._write_parquet_partitioned(batch)
 
             # Write health data if available and enabled
             if self.config.health_enabled and self.health_buffer:
                 self._write_health_parquet()
 
             # Clear buffer and calculate next boundary
-            self.buffer.clear()
+            self.buffer = self._new_buffer()
+            self.buffer_rows = 0
             self.next_batch_time = self._calculate_next_batch_boundary()
+            self.next_batch_deadline = self._monotonic_deadline(self.next_batch_time)
 
             duration = time.time() - start_time
             log_batch_write(count, self.config.output_dir, duration, self.logger)
@@ -466,43 +572,6 @@ class PolarsSensorCollector:
         except Exception as e:
             log_error(e, self.logger, "Failed to flush batch")
 
-    def _optimize_dtypes(self, df: pl.DataFrame) -> pl.DataFrame:
-        """Optimize column data types for memory efficiency."""
-        float_cols = [
-            "temperature",
-            "raw_temperature",
-            "pressure",
-            "humidity",
-            "raw_humidity",
-            "oxidised",
-            "reducing",
-            "nh3",
-            "lux",
-            "proximity",
-            "pm1",
-            "pm25",
-            "pm10",
-            "particles_03um",
-            "particles_05um",
-            "particles_10um",
-            "particles_25um",
-            "particles_50um",
-            "particles_100um",
-        ]
-
-        # Convert all float columns to Float32 for memory efficiency
-        for col in float_cols:
-            if col in df.columns:
-                df = df.with_columns(pl.col(col).cast(pl.Float32))
-
-        # Ensure timestamp is datetime (not string)
-        if "timestamp" in df.columns:
-            df = df.with_columns(
-                pl.col("timestamp").cast(pl.Datetime(time_unit="ms", time_zone="UTC"))
-            )
-
-        return df
-
     def should_sync(self) -> bool:
         """
         Check if it's time to sync to cloud storage.
@@ -510,14 +579,14 @@ class PolarsSensorCollector:
         Uses clock-aligned boundaries (00, 15, 30, 45 minutes) instead of elapsed time.
         This ensures consistent sync times across all sensors, matching batch writes.
         """
-        if not self.next_sync_time:
+        if self.next_sync_deadline is None:
             return False
 
         has_sync = (self.sync_client is not None) or (self.health_sync_client is not None)
         if not has_sync:
             return False
 
-        return datetime.now(timezone.utc) >= self.next_sync_time
+        return time.monotonic() >= self.next_sync_deadline
 
     def sync_data(self) -> None:
         """Sync data to cloud storage."""
@@ -554,12 +623,46 @@ class PolarsSensorCollector:
                 interval = self.health_storage_config.sync_interval_minutes
 
             self.next_sync_time = self._calculate_next_sync_boundary(interval)
+            self.next_sync_deadline = self._monotonic_deadline(self.next_sync_time)
             self.logger.info(f"Next sync at: {self.next_sync_time.strftime('%H:%M:%S UTC')}")
 
         except Exception as e:
             log_error(e, self.logger, "Cloud sync failed")
 
-    def _write_parquet_partitioned(self, df: pl.DataFrame) -> None:
+    def _start_background_sync(self) -> None:
+        """Run sync_data on the sync thread, unless the previous sync is still running."""
+        if self._sync_future is not None and not self._sync_future.done():
+            return
+        if self._sync_executor is None:
+            self._sync_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sync")
+        self._sync_future = self._sync_executor.submit(self.sync_data)
+
+    def _stop_background_sync(self) -> None:
+        """Wait for an in-flight background sync to finish and stop the sync thread."""
+        if self._sync_executor is not None:
+            self._sync_executor.shutdown(wait=True)
+            self._sync_executor = None
+            self._sync_future = None
+
+    def _day_partition(self, station_dir: Path, ts: datetime) -> Path:
+        """
+        Return the year={y}/month={m}/day={d} partition directory for ts.
+
+        The directory is created the first time a station directory moves to a new
+        day; later flushes on the same day reuse the cached path without a mkdir.
+        """
+        day_key = (ts.year, ts.month, ts.day)
+        cached = self._day_partitions.get(station_dir)
+        if cached is not None and cached[0] == day_key:
+            return cached[1]
+
+        year, month, day = day_key
+        path = station_dir / f"year={year}" / f"month={month:02d}" / f"day={day:02d}"
+        path.mkdir(parents=True, exist_ok=True)
+        self._day_partitions[station_dir] = (day_key, path)
+        return path
+
+    def _write_parquet_partitioned(self, batch: pa.RecordBatch) -> None:
         """
         Write Hive-partitioned Parquet files matching opensensor.space architecture.
 
@@ -568,53 +671,72 @@ class PolarsSensorCollector:
         Note: station_id is NOT stored in the parquet file itself - it's only in the
         directory structure. DuckDB automatically extracts it with hive_partitioning=true.
         This follows Hive partitioning best practices and reduces file size.
+
+        The batch is written with PyArrow as-is; each flush still produces its own
+        closed file so sync never uploads a Parquet file that is missing its footer.
         """
         # Get batch end time for filename
         batch_end = datetime.now(timezone.utc)
 
         # Extract partition values from first timestamp in batch
-        first_ts = df["timestamp"][0]
-        if isinstance(first_ts, str):
-            first_ts = datetime.fromisoformat(first_ts.replace("Z", "+00:00"))
-
-        year = first_ts.year
-        month = first_ts.month
-        day = first_ts.day
+        first_ts = batch.column("timestamp")[0].as_py()
 
         # Create filename with batch end time (HHMM format)
-        filename = f"data_{batch_end.strftime('%H%M')}.parquet"
+        filename = f"data_{batch_end.hour:02d}{batch_end.minute:02d}.parquet"
 
         # Build Hive-partitioned path
-        partition_path = (
-            self.config.output_dir
-            / f"station={self.config.station_id}"
-            / f"year={year}"
-            / f"month={month:02d}"
-            / f"day={day:02d}"
-        )
-
-        # Create directory structure
-        partition_path.mkdir(parents=True, exist_ok=True)
+        partition_path = self._day_partition(self._station_dir, first_ts)
 
         # Full file path
         file_path = partition_path / filename
 
-        # Remove partition columns from dataframe (station_id is in directory structure)
-        # This follows Hive partitioning best practices and reduces file size
-        df_to_write = df.drop("station_id")
+        table = pa.Table.from_batches([batch])
 
-        # Write Parquet with compression
-        df_to_write.write_parquet(
-            str(file_path),
-            compression=self.config.compression,
-            statistics=True,
-            use_pyarrow=True,  # Use PyArrow for better compatibility and file size
-        )
+        # Write Parquet with compression. A batch is a single row group, and the
+        # float columns are mostly distinct values, so dictionary pages only add bytes.
+        # The file is renamed into place once complete, so neither a background sync
+        # nor a power cut can leave a half-written file behind.
+        compression = self.config.compression
+        tmp_path = file_path.with_name(f".{filename}.tmp")
+        try:
+            pq.write_table(
+                table,
+                tmp_path,
+                compression=None if compression == "uncompressed" else compression,
+                row_group_size=table.num_rows,
+                use_dictionary=False,
+                write_statistics=True,
+            )
+        except FileNotFoundError:
+            # Partition directory was removed while running; recreate it on the retry
+            self._day_partitions.pop(self._station_dir, None)
+            raise
+        self._replace_durably(tmp_path, file_path)
 
         self.logger.debug(
-            f"Wrote {len(df_to_write)} rows to {partition_path.relative_to(self.config.output_dir)}/{filename}"
+            f"Wrote {table.num_rows} rows to {partition_path.relative_to(self.config.output_dir)}/{filename}"
         )
 
+    @staticmethod
+    def _replace_durably(tmp_path: Path, file_path: Path) -> None:
+        """
+        Atomically move a fully written file into place and persist the rename.
+
+        The file is fsynced before the rename and its directory after, so a power
+        cut leaves either no file or the complete one - never a truncated Parquet.
+        """
+        fd = os.open(tmp_path, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        tmp_path.replace(file_path)
+        fd = os.open(file_path.parent, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
     def _write_health_parquet(self) -> None:
         """
         Write system health metrics to a separate Parquet file.
@@ -631,46 +753,35 @@ class PolarsSensorCollector:
 
         batch_end = datetime.now(timezone.utc)
 
-        # Create health DataFrame
-        df = pl.DataFrame(self.health_buffer)
-
-        # Extract partition values from first timestamp
-        first_ts = df["timestamp"][0]
-        if isinstance(first_ts, str):
-            first_ts = datetime.fromisoformat(first_ts.replace("Z", "+00:00"))
+        # Create health table (station_id is only in the partition path)
+        table = pa.Table.from_pylist(self.health_buffer)
 
-        year = first_ts.year
-        month = first_ts.month
-        day = first_ts.day
+        # Extract partition values from first timestamp (an aware datetime)
+        first_ts = self.health_buffer[0]["timestamp"]
 
-        filename = f"health_{batch_end.strftime('%H%M')}.parquet"
+        filename = f"health_{batch_end.hour:02d}{batch_end.minute:02d}.parquet"
 
         # Health data goes in a sibling directory (output-health instead of output)
         # This keeps sensor and health data completely separate with identical partition structure
-        health_output_dir = self.config.health_dir
-        partition_path = (
-            health_output_dir
-            / f"station={self.config.station_id}"
-            / f"year={year}"
-            / f"month={month:02d}"
-            / f"day={day:02d}"
-        )
-
-        partition_path.mkdir(parents=True, exist_ok=True)
+        partition_path = self._day_partition(self._health_station_dir, first_ts)
         file_path = partition_path / filename
 
-        # Remove station_id (in directory structure)
-        df_to_write = df.drop("station_id")
-
-        df_to_write.write_parquet(
-            str(file_path),
-            compression=self.config.compression,
-            statistics=True,
-            use_pyarrow=True,
-        )
+        tmp_path = file_path.with_name(f".{filename}.tmp")
+        try:
+            compression = self.config.compression
+            pq.write_table(
+                table,
+                tmp_path,
+                compression=None if compression == "uncompressed" else compression,
+                write_statistics=True,
+            )
+        except FileNotFoundError:
+            self._day_partitions.pop(self._health_station_dir, None)
+            raise
+        self._replace_durably(tmp_path, file_path)
 
         self.health_buffer.clear()
-        self.logger.debug(f"Wrote {len(df_to_write)} health records to {filename}")
+        self.logger.debug(f"Wrote {table.num_rows} health records to {filename}")
 
     def run(self) -> None:
         """Main collection loop."""
@@ -736,6 +847,10 @@ class PolarsSensorCollector:
             )
 
         try:
+            # Fixed-cadence ticks on the monotonic clock: read and write time is
+            # absorbed into the interval instead of being added to it
+            interval = self.config.read_interval
+            next_tick = time.monotonic()
             while True:
                 self.collect_reading()
 
@@ -743,18 +858,29 @@ class PolarsSensorCollector:
                     self.flush_batch()
 
                 if self.should_sync():
-                    self.sync_data()
+                    self._start_background_sync()
 
-                time.sleep(self.config.read_interval)
+                next_tick += interval
+                sleep_for = next_tick - time.monotonic()
+                if sleep_for > 0:
+                    time.sleep(sleep_for)
+                elif sleep_for < -interval:
+                    # Fell more than a tick behind (slow sync); resume from now
+                    # rather than firing a burst of catch-up readings
+                    next_tick = time.monotonic()
 
         except KeyboardInterrupt:
             self.logger.info("Stopping collection...")
-            if self.buffer:
+            if self.buffer_rows:
                 self.flush_batch()
-            # Final sync on exit
+            # Final sync on exit, after any background sync has finished
+            self._stop_background_sync()
             if self.sync_client or self.health_sync_client:
                 self.logger.info("Performing final sync...")
                 self.sync_data()
         except Exception as e:
             log_error(e, self.logger, "Collection error")
             raise
+        finally:
+            self._stop_background_sync()
+            self.close()
@@ -4,11 +4,26 @@ Supports environment variables, .env files, and CLI overrides.
 """
 
 from pathlib import Path
+from typing import Any
 from uuid import UUID
 
-from pydantic import Field, field_validator, model_validator
+from pydantic import Field, ValidationInfo, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Shared by all settings classes; HealthStorageConfig only swaps the env prefix
+_SETTINGS_CONFIG = SettingsConfigDict(
+    env_prefix="OPENSENSOR_",
+    env_file=".env",
+    env_file_encoding="utf-8",
+    case_sensitive=False,
+    extra="ignore",
+    frozen=True,
+)
+
+_VALID_PROVIDERS = frozenset(
+    {"s3", "r2", "gcs", "azure", "minio", "wasabi", "backblaze", "hetzner"}
+)
+
 
 class SensorConfig(BaseSettings):
     """Sensor collection configuration."""
@@ -40,20 +55,16 @@ class SensorConfig(BaseSettings):
     compression: str = Field(
         default="zstd", description="Compression codec for Parquet files (snappy, zstd, gzip)"
     )
-    health_dir: Path | None = Field(default=None, description="Directory for health data")
+    health_dir: Path | None = Field(
+        default=None, validate_default=True, description="Directory for health data"
+    )
 
     # Health monitoring
     health_enabled: bool = Field(
         default=True, description="Enable system health monitoring (CPU, memory, WiFi, NTP sync)"
     )
 
-    model_config = SettingsConfigDict(
-        env_prefix="OPENSENSOR_",
-        env_file=".env",
-        env_file_encoding="utf-8",
-        case_sensitive=False,
-        extra="ignore",
-    )
+    model_config = _SETTINGS_CONFIG
 
     @field_validator("output_dir", mode="before")
     @classmethod
@@ -61,14 +72,17 @@ class SensorConfig(BaseSettings):
         """Expand ~ and environment variables in paths."""
         return Path(v).expanduser().resolve()
 
-    @model_validator(mode="after")
-    def compute_health_dir(self) -> "SensorConfig":
+    @field_validator("health_dir")
+    @classmethod
+    def compute_health_dir(cls, v: Path | None, info: ValidationInfo) -> Path | None:
         """Default health_dir to output_dir + '-health' if not set or empty."""
         # Handle None, empty Path(""), and Path(".") cases
         # Note: Path("") becomes Path(".") which str() returns "."
-        if self.health_dir is None or str(self.health_dir) in ("", "."):
-            self.health_dir = Path(str(self.output_dir) + "-health")
-        return self
+        # output_dir is declared first, so it is already validated (unless it failed)
+        output_dir = info.data.get("output_dir")
+        if (v is None or str(v) in ("", ".")) and output_dir is not None:
+            return output_dir.with_name(f"{output_dir.name}-health")
+        return v
 
 
 class StorageConfig(BaseSettings):
@@ -117,25 +131,18 @@ class StorageConfig(BaseSettings):
     azure_storage_key: str | None = Field(default=None, description="Azure storage account key")
     azure_sas_token: str | None = Field(default=None, description="Azure SAS token")
 
-    model_config = SettingsConfigDict(
-        env_prefix="OPENSENSOR_",
-        env_file=".env",
-        env_file_encoding="utf-8",
-        case_sensitive=False,
-        extra="ignore",
-    )
+    model_config = _SETTINGS_CONFIG
 
     @field_validator("storage_provider")
     @classmethod
     def validate_provider(cls, v: str) -> str:
         """Validate storage provider is supported."""
-        valid_providers = {"s3", "r2", "gcs", "azure", "minio", "wasabi", "backblaze", "hetzner"}
         v_lower = v.lower()
-        if v_lower not in valid_providers:
-            raise ValueError(
-                f"Invalid provider '{v}'. Must be one of: {', '.join(valid_providers)}"
-            )
-        return v_lower
+        if v_lower in _VALID_PROVIDERS:
+            return v_lower
+        raise ValueError(
+            f"Invalid provider '{v}'. Must be one of: {', '.join(sorted(_VALID_PROVIDERS))}"
+        )
 
 
 class HealthStorageConfig(StorageConfig):
@@ -144,13 +151,7 @@ class HealthStorageConfig(StorageConfig):
     Inherits all fields from StorageConfig but uses OPENSENSOR_HEALTH_ prefix.
     """
 
-    model_config = SettingsConfigDict(
-        env_prefix="OPENSENSOR_HEALTH_",
-        env_file=".env",
-        env_file_encoding="utf-8",
-        case_sensitive=False,
-        extra="ignore",
-    )
+    model_config = SettingsConfigDict(_SETTINGS_CONFIG, env_prefix="OPENSENSOR_HEALTH_")
 
     @classmethod
     def with_fallback(cls, main_config: StorageConfig | None) -> "HealthStorageConfig":
@@ -179,13 +180,17 @@ class HealthStorageConfig(StorageConfig):
         if main_config is None:
             return health_config
 
+        # All fallbacks are collected here and applied in a single copy at the end
+        updates: dict[str, Any] = {}
+
         # Inherit sync_enabled if not explicitly set and main is enabled
-        if not health_config.sync_enabled and main_config.sync_enabled:
-            health_config = health_config.model_copy(update={"sync_enabled": True})
+        sync_enabled = health_config.sync_enabled or main_config.sync_enabled
+        if sync_enabled and not health_config.sync_enabled:
+            updates["sync_enabled"] = True
 
         # If health sync is enabled but no bucket configured, inherit everything
-        if health_config.sync_enabled and not health_config.storage_bucket:
-            updates = {
+        if sync_enabled and not health_config.storage_bucket:
+            updates |= {
                 "storage_provider": main_config.storage_provider,
                 "storage_bucket": main_config.storage_bucket,
                 "storage_region": main_config.storage_region,
@@ -201,17 +206,13 @@ class HealthStorageConfig(StorageConfig):
             if not health_config.storage_prefix and main_config.storage_prefix:
                 updates["storage_prefix"] = f"{main_config.storage_prefix}-health"
 
-            health_config = health_config.model_copy(update=updates)
-
         # If bucket is set but credentials are missing, inherit credentials only
         # (user may have set a custom prefix but wants to reuse main credentials)
         elif (
-            health_config.sync_enabled
+            sync_enabled
             and health_config.storage_bucket
             and health_config.storage_provider == main_config.storage_provider
         ):
-            updates = {}
-
             # Inherit S3-compatible credentials
             if not health_config.aws_access_key_id and main_config.aws_access_key_id:
                 updates["aws_access_key_id"] = main_config.aws_access_key_id
@@ -236,8 +237,9 @@ class HealthStorageConfig(StorageConfig):
             if not health_config.storage_endpoint and main_config.storage_endpoint:
                 updates["storage_endpoint"] = main_config.storage_endpoint
 
-            if updates:
-                health_config = health_config.model_copy(update=updates)
+        # Values come from already-validated models, so copying skips re-validation
+        if updates:
+            health_config = health_config.model_copy(update=updates)
 
         return health_config
 
@@ -250,13 +252,7 @@ class AppConfig(BaseSettings):
     log_dir: Path = Field(default=Path("logs"), description="Directory for log files")
     log_json: bool = Field(default=False, description="Use JSON log format")
 
-    model_config = SettingsConfigDict(
-        env_prefix="OPENSENSOR_",
-        env_file=".env",
-        env_file_encoding="utf-8",
-        case_sensitive=False,
-        extra="ignore",
-    )
+    model_config = _SETTINGS_CONFIG
 
     @field_validator("log_dir", mode="before")
     @classmethod
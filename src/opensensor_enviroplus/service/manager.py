@@ -11,6 +11,7 @@ Key principles:
 4. Provide clear feedback about what was detected
 """
 
+import functools
 import os
 import shutil
 import subprocess
@@ -28,6 +29,9 @@ from opensensor_enviroplus.utils.env import (
     get_user_home,
 )
 
+# Standard system directories, always appended to the service's PATH
+_SYSTEM_PATHS = ("/usr/local/sbin", "/usr/local/bin", "/usr/sbin", "/usr/bin", "/sbin", "/bin")
+
 
 @dataclass
 class ExecutableInfo:
@@ -143,11 +147,12 @@ class ServiceManager:
         # Method 1: Use shutil.which (most reliable - respects PATH)
         which_result = shutil.which(cli_name)
         if which_result:
+            # which() only returns existing executables, so no extra stat is needed
             path = Path(which_result).resolve()
-            return ExecutableInfo(path=path, exists=path.exists(), source="PATH (shutil.which)")
+            return ExecutableInfo(path=path, exists=True, source="PATH (shutil.which)")
 
         # Method 2: Try uv tool dir --bin if uv is available
-        uv_bin_dir = self._get_uv_tool_bin_dir()
+        uv_bin_dir = self._uv_tool_bin_dir
         if uv_bin_dir:
             uv_cli = uv_bin_dir / cli_name
             if uv_cli.exists():
@@ -176,8 +181,9 @@ class ServiceManager:
         # Not found - return None with diagnostic info
         return None
 
-    def _get_uv_tool_bin_dir(self) -> Path | None:
-        """Get uv's tool bin directory by running 'uv tool dir --bin'."""
+    @functools.cached_property
+    def _uv_tool_bin_dir(self) -> Path | None:
+        """uv's tool bin directory from 'uv tool dir --bin', run at most once per manager."""
         try:
             result = subprocess.run(
                 ["uv", "tool", "dir", "--bin"],
@@ -210,8 +216,8 @@ class ServiceManager:
         # Use shared find_env_file utility
         env_file = find_env_file()
 
-        if env_file and env_file.exists():
-            # Use the directory containing .env as working directory
+        if env_file:
+            # Use the directory containing .env as working directory (it was found on disk)
             return env_file.parent, env_file
 
         # No .env found - return cwd and expected location
@@ -258,6 +264,18 @@ class ServiceManager:
         except FileNotFoundError:
             return 1, "", "systemctl command not found (is systemd installed?)"
 
+    def _run_systemctl_quiet(self, *args: str) -> int:
+        """Run systemctl command for its exit code only (no output pipes or decoding)."""
+        try:
+            return subprocess.run(
+                ["systemctl", "--quiet", *args],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=30,
+            ).returncode
+        except (subprocess.TimeoutExpired, FileNotFoundError):
+            return 1
+
     def _build_path_env(self) -> str:
         """Build PATH environment variable dynamically."""
         path_parts: list[str] = []
@@ -282,7 +300,7 @@ class ServiceManager:
         add_path(self._get_xdg_bin_dir(self.env.home))
 
         # 4. uv tool bin directory
-        uv_bin = self._get_uv_tool_bin_dir()
+        uv_bin = self._uv_tool_bin_dir
         if uv_bin:
             add_path(uv_bin)
 
@@ -290,18 +308,7 @@ class ServiceManager:
         add_path(self.env.python_executable.parent)
 
         # 6. Standard system paths
-        system_paths = [
-            "/usr/local/sbin",
-            "/usr/local/bin",
-            "/usr/sbin",
-            "/usr/bin",
-            "/sbin",
-            "/bin",
-        ]
-        for p in system_paths:
-            path_parts.append(p)
-
-        return ":".join(path_parts)
+        return ":".join([*path_parts, *_SYSTEM_PATHS])
 
     def _generate_service_content(self) -> str:
         """Generate systemd service file content."""
@@ -457,17 +464,19 @@ WantedBy=multi-user.target
         self.service_file.unlink()
         self._run_systemctl("daemon-reload")
 
-    def enable(self) -> None:
-        """Enable the service to start on boot."""
+    def enable(self, now: bool = False) -> None:
+        """Enable the service to start on boot (and start it too if now=True)."""
         self._require_sudo()
-        returncode, _, stderr = self._run_systemctl("enable", self.SERVICE_NAME)
+        flags = ("--now",) if now else ()
+        returncode, _, stderr = self._run_systemctl("enable", *flags, self.SERVICE_NAME)
         if returncode != 0:
             raise RuntimeError(f"Failed to enable service: {stderr}")
 
-    def disable(self) -> None:
-        """Disable the service from starting on boot."""
+    def disable(self, now: bool = False) -> None:
+        """Disable the service from starting on boot (and stop it too if now=True)."""
         self._require_sudo()
-        returncode, _, stderr = self._run_systemctl("disable", self.SERVICE_NAME)
+        flags = ("--now",) if now else ()
+        returncode, _, stderr = self._run_systemctl("disable", *flags, self.SERVICE_NAME)
         if returncode != 0:
             raise RuntimeError(f"Failed to disable service: {stderr}")
 
@@ -494,10 +503,29 @@ WantedBy=multi-user.target
 
     def status(self) -> tuple[str, bool]:
         """Get service status. Returns (status_output, is_active)."""
-        _, stdout, stderr = self._run_systemctl("status", self.SERVICE_NAME)
-        _, active_stdout, _ = self._run_systemctl("is-active", self.SERVICE_NAME)
-        is_active = active_stdout.strip() == "active"
-        return stdout if stdout else stderr, is_active
+        # systemctl status exits 0 only for an active unit (3 = inactive, 4 = no such unit)
+        returncode, stdout, stderr = self._run_systemctl("status", self.SERVICE_NAME)
+        return stdout if stdout else stderr, returncode == 0
+
+    def snapshot(self) -> dict[str, str]:
+        """
+        Get unit state with a single systemctl call.
+
+        Returns a dict with ActiveState and UnitFileState keys
+        (empty values if systemctl is unavailable).
+        """
+        _, stdout, _ = self._run_systemctl(
+            "show",
+            f"{self.SERVICE_NAME}.service",
+            "--property=ActiveState,UnitFileState",
+            "--no-pager",
+        )
+        snap = {"ActiveState": "", "UnitFileState": ""}
+        for line in stdout.splitlines():
+            key, sep, value = line.partition("=")
+            if sep and key in snap:
+                snap[key] = value.strip()
+        return snap
 
     def is_installed(self) -> bool:
         """Check if the service file exists."""
@@ -505,26 +533,25 @@ WantedBy=multi-user.target
 
     def is_enabled(self) -> bool:
         """Check if the service is enabled."""
+        # Needs the output: is-enabled also exits 0 for static/alias/indirect units
         returncode, stdout, _ = self._run_systemctl("is-enabled", self.SERVICE_NAME)
         return returncode == 0 and stdout.strip() == "enabled"
 
     def is_active(self) -> bool:
         """Check if the service is currently running."""
-        returncode, stdout, _ = self._run_systemctl("is-active", self.SERVICE_NAME)
-        return returncode == 0 and stdout.strip() == "active"
+        # is-active exits 0 only for an active unit
+        return self._run_systemctl_quiet("is-active", self.SERVICE_NAME) == 0
 
     def get_logs(self, lines: int = 50, follow: bool = False) -> None:
         """Show service logs using journalctl."""
-        cmd = ["journalctl", "-u", self.SERVICE_NAME, "-n", str(lines)]
+        cmd = ["journalctl", "-u", self.SERVICE_NAME, "-n", str(lines), "--no-pager"]
         if follow:
             cmd.append("-f")
 
         try:
-            if follow:
-                subprocess.run(cmd)
-            else:
-                result = subprocess.run(cmd, capture_output=True, text=True)
-                print(result.stdout)
+            # journalctl already limits output to the last N lines; let it write
+            # straight to our stdout instead of buffering the output in memory
+            subprocess.run(cmd)
         except KeyboardInterrupt:
             pass
         except FileNotFoundError as e:
@@ -533,6 +560,9 @@ WantedBy=multi-user.target
     def get_info(self) -> dict:
         """Get comprehensive information about detected environment."""
         cli_info = self.env.cli_executable
+        installed = self.is_installed()
+        # One systemctl call covers both enabled and active state
+        snap = self.snapshot() if installed else None
         return {
             # User info
             "user": self.env.user,
@@ -554,9 +584,9 @@ WantedBy=multi-user.target
             # Service status
             "service_name": self.SERVICE_NAME,
             "service_file": str(self.service_file),
-            "installed": self.is_installed(),
-            "enabled": self.is_enabled() if self.is_installed() else False,
-            "active": self.is_active() if self.is_installed() else False,
+            "installed": installed,
+            "enabled": snap["UnitFileState"] == "enabled" if snap else False,
+            "active": snap["ActiveState"] == "active" if snap else False,
             # PATH that will be used
             "path_env": self._build_path_env(),
         }
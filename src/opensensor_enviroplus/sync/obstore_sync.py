@@ -19,6 +19,7 @@ Features:
 - Bandwidth efficient
 """
 
+import hashlib
 import logging
 from datetime import datetime, timezone
 from pathlib import Path
@@ -65,6 +66,9 @@ class ObstoreSync:
         self.logger = logger
         self.store: S3Store | GCSStore | AzureStore | None = None
         self.remote_cache: dict[str, dict] = {}  # Cache of remote file metadata
+        # Remote path -> (size, mtime_ns, remote ETag) of a local file known to match
+        # the remote copy, so unchanged files aren't re-hashed on every sync
+        self.verified: dict[str, tuple[int, int, str | None]] = {}
         self.is_offline = False  # Track offline state
 
         if config.sync_enabled:
@@ -438,8 +442,6 @@ class ObstoreSync:
         Returns:
             ETag string (MD5 hash in quotes, matching S3 format)
         """
-        import hashlib
-
         md5 = hashlib.md5()
         with file_path.open("rb") as f:
             # Read in chunks to handle larger files efficiently
@@ -474,7 +476,8 @@ class ObstoreSync:
         remote_meta = self.remote_cache[remote_path]
 
         # Quick size check first (avoid MD5 calculation if size differs)
-        local_size = local_path.stat().st_size
+        local_stat = local_path.stat()
+        local_size = local_stat.st_size
         if local_size != remote_meta["size"]:
             self.logger.debug(
                 f"{local_path.name}: size mismatch "
@@ -482,9 +485,14 @@ class ObstoreSync:
             )
             return True
 
+        # Neither the local file nor the remote object changed since they last matched
+        remote_etag = remote_meta.get("e_tag", "")
+        version = (local_size, local_stat.st_mtime_ns, remote_etag)
+        if self.verified.get(remote_path) == version:
+            return False
+
         # Content-based comparison using ETag (MD5 hash)
         local_etag = self._calculate_etag(local_path)
-        remote_etag = remote_meta.get("e_tag", "")
 
         if local_etag != remote_etag:
             self.logger.debug(
@@ -494,6 +502,7 @@ class ObstoreSync:
             return True
 
         # Content matches - skip upload
+        self.verified[remote_path] = version
         self.logger.debug(f"{local_path.name}: content matches (ETag: {local_etag[:16]}...)")
         return False
 
@@ -509,18 +518,25 @@ class ObstoreSync:
 
             # Upload to store using put
             # Note: S3 automatically validates Content-MD5 on upload
-            self.store.put(remote_path, data)
+            result = self.store.put(remote_path, data)
 
             # Update cache with new file metadata
             local_stat = local_path.stat()
-            local_etag = self._calculate_etag(local_path)
+            local_etag = f'"{hashlib.md5(data).hexdigest()}"'
+            remote_etag = result.get("e_tag") or local_etag
 
             self.remote_cache[remote_path] = {
                 "path": remote_path,
                 "size": local_stat.st_size,
                 "last_modified": datetime.fromtimestamp(local_stat.st_mtime, tz=timezone.utc),
-                "e_tag": local_etag,
+                "e_tag": remote_etag,
             }
+            if local_stat.st_size == len(data):
+                self.verified[remote_path] = (
+                    local_stat.st_size,
+                    local_stat.st_mtime_ns,
+                    remote_etag,
+                )
 
             self.logger.debug(f"Uploaded {local_path.name} (ETag: {local_etag[:16]}...)")
 
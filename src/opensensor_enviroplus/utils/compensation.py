@@ -4,11 +4,14 @@ Temperature and humidity compensation utilities.
 
 from pathlib import Path
 
+# Raspberry Pi SoC temperature in millidegrees Celsius
+CPU_TEMP_PATH = Path("/sys/class/thermal/thermal_zone0/temp")
+
 
 def get_cpu_temperature() -> float:
     """Get CPU temperature for compensation."""
     try:
-        with Path("/sys/class/thermal/thermal_zone0/temp").open() as f:
+        with CPU_TEMP_PATH.open() as f:
             return float(f.read()) / 1000.0
     except (OSError, ValueError):
         return 40.0
@@ -8,25 +8,43 @@ Shared functions for:
 - Path discovery
 """
 
+import contextlib
+import functools
 import os
+import re
 import sys
 from pathlib import Path
 
+# Every line break str.splitlines() recognises, mapped to "\n" so the regex below
+# splits lines exactly as splitlines() does (bare "\r", form feed, U+2028, ...)
+_LINE_BREAKS = str.maketrans(dict.fromkeys("\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029", "\n"))
+
+# One KEY=VALUE per line: surrounding whitespace trimmed, "#" comment lines skipped
+_ENV_LINE_RE = re.compile(
+    r"^(?![^\S\n]*#)[^\S\n]*([^=\n]*?)[^\S\n]*=[^\S\n]*(.*?)[^\S\n]*$", re.MULTILINE
+)
+
 
 def get_current_user() -> str:
     """Get the current user, handling sudo correctly."""
     return os.environ.get("SUDO_USER") or os.environ.get("USER") or "root"
 
 
+@functools.cache
+def _passwd_entry(username: str):
+    """pwd entry for a user, looked up once per process (NSS may be slow)."""
+    import pwd
+
+    return pwd.getpwnam(username)
+
+
 def get_user_home(username: str | None = None) -> Path:
     """Get home directory for a user."""
     if username is None:
         username = get_current_user()
 
     try:
-        import pwd
-
-        return Path(pwd.getpwnam(username).pw_dir)
+        return Path(_passwd_entry(username).pw_dir)
     except (ImportError, KeyError):
         return Path(os.environ.get("HOME", f"/home/{username}"))
 
@@ -38,10 +56,8 @@ def get_user_group(username: str | None = None) -> str:
 
     try:
         import grp
-        import pwd
 
-        user_info = pwd.getpwnam(username)
-        group_info = grp.getgrgid(user_info.pw_gid)
+        group_info = grp.getgrgid(_passwd_entry(username).pw_gid)
         return group_info.gr_name
     except (ImportError, KeyError):
         return username
@@ -60,6 +76,17 @@ def detect_virtual_env() -> Path | None:
     return None
 
 
+@functools.cache
+def _in_source_tree() -> bool:
+    """Whether this module lives under a directory with a pyproject.toml (walked once)."""
+    try:
+        return any(
+            (parent / "pyproject.toml").exists() for parent in Path(__file__).resolve().parents
+        )
+    except Exception:
+        return False
+
+
 def detect_installation_type() -> str:
     """
     Detect how the package was installed.
@@ -83,13 +110,8 @@ def detect_installation_type() -> str:
         return "uv_tool"
 
     # Check for editable install (source directory with pyproject.toml)
-    try:
-        current = Path(__file__).resolve()
-        for parent in current.parents:
-            if (parent / "pyproject.toml").exists():
-                return "editable"
-    except Exception:
-        pass
+    if _in_source_tree():
+        return "editable"
 
     # Check for virtual environment
     if os.environ.get("VIRTUAL_ENV"):
@@ -112,21 +134,13 @@ def parse_env_file(env_path: Path) -> dict[str, str]:
     Returns:
         Dictionary of KEY=VALUE pairs (comments and empty lines are skipped)
     """
-    config: dict[str, str] = {}
-    if not env_path.exists():
-        return config
-
-    for line in env_path.read_text().splitlines():
-        line = line.strip()
-        # Skip comments and empty lines
-        if not line or line.startswith("#"):
-            continue
-        # Parse KEY=VALUE
-        if "=" in line:
-            key, _, value = line.partition("=")
-            config[key.strip()] = value.strip()
+    try:
+        text = env_path.read_text()
+    except FileNotFoundError:
+        return {}
 
-    return config
+    # Single regex pass over the whole file; later keys override earlier ones
+    return dict(_ENV_LINE_RE.findall(text.translate(_LINE_BREAKS)))
 
 
 def find_env_file(search_paths: list[Path] | None = None) -> Path | None:
@@ -215,7 +229,7 @@ def write_env_file(
 
     if sync_enabled:
         lines.extend(
-            [
+            (
                 "",
                 "# Cloud Sync",
                 f"OPENSENSOR_SYNC_ENABLED={config.get('OPENSENSOR_SYNC_ENABLED', 'false')}",
@@ -229,7 +243,7 @@ def write_env_file(
                 "# AWS Credentials",
                 f"OPENSENSOR_AWS_ACCESS_KEY_ID={config.get('OPENSENSOR_AWS_ACCESS_KEY_ID', '')}",
                 f"OPENSENSOR_AWS_SECRET_ACCESS_KEY={config.get('OPENSENSOR_AWS_SECRET_ACCESS_KEY', '')}",
-            ]
+            )
         )
         if endpoint := config.get("OPENSENSOR_STORAGE_ENDPOINT"):
             lines.append(f"OPENSENSOR_STORAGE_ENDPOINT={endpoint}")
@@ -237,7 +251,7 @@ def write_env_file(
         # Add commented template
         short_id = station_id[:8] if station_id else "xxxxxxxx"
         lines.extend(
-            [
+            (
                 "",
                 "# Cloud Sync (uncomment and configure to enable)",
                 "# OPENSENSOR_SYNC_ENABLED=true",
@@ -254,26 +268,24 @@ def write_env_file(
                 "",
                 "# MinIO/Custom S3 Endpoint (optional)",
                 "# OPENSENSOR_STORAGE_ENDPOINT=https://minio.example.com:9000",
-            ]
+            )
         )
 
     # Health Storage Configuration (if different from main)
     # We check if any health-specific storage keys exist
-    health_storage_keys = [k for k in config if k.startswith("OPENSENSOR_HEALTH_STORAGE_")]
-
-    if health_storage_keys:
+    if any(k.startswith("OPENSENSOR_HEALTH_STORAGE_") for k in config):
         lines.extend(
-            [
+            (
                 "",
                 "# Health Data Storage (Separate)",
                 f"OPENSENSOR_HEALTH_STORAGE_PROVIDER={config.get('OPENSENSOR_HEALTH_STORAGE_PROVIDER', 's3')}",
                 f"OPENSENSOR_HEALTH_STORAGE_BUCKET={config.get('OPENSENSOR_HEALTH_STORAGE_BUCKET', '')}",
                 f"OPENSENSOR_HEALTH_STORAGE_PREFIX={config.get('OPENSENSOR_HEALTH_STORAGE_PREFIX', '')}",
                 f"OPENSENSOR_HEALTH_STORAGE_REGION={config.get('OPENSENSOR_HEALTH_STORAGE_REGION', 'us-west-2')}",
-            ]
+            )
         )
         # Add optional health storage keys if present
-        for key in [
+        for key in (
             "OPENSENSOR_HEALTH_AWS_ACCESS_KEY_ID",
             "OPENSENSOR_HEALTH_AWS_SECRET_ACCESS_KEY",
             "OPENSENSOR_HEALTH_STORAGE_ENDPOINT",
@@ -281,11 +293,36 @@ def write_env_file(
             "OPENSENSOR_HEALTH_AZURE_STORAGE_ACCOUNT",
             "OPENSENSOR_HEALTH_AZURE_STORAGE_KEY",
             "OPENSENSOR_HEALTH_AZURE_SAS_TOKEN",
-        ]:
+        ):
             if val := config.get(key):
                 lines.append(f"{key}={val}")
 
-    env_path.write_text("\n".join(lines) + "\n")
+    lines.append("")
+
+    # Write atomically: readers (a starting service) never see a half-written file.
+    # The file may hold credentials, so the temp file is created with the old file's
+    # mode (0600 for a new one) and owner - never briefly readable by other users.
+    try:
+        old_stat = env_path.stat()
+    except FileNotFoundError:
+        old_stat = None
+    mode = old_stat.st_mode & 0o777 if old_stat else 0o600
+
+    tmp_path = env_path.with_name(env_path.name + ".tmp")
+    with contextlib.suppress(FileNotFoundError):
+        tmp_path.unlink()  # stale leftover; O_EXCL below guarantees a fresh file
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, mode)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            if old_stat and hasattr(os, "fchown"):
+                with contextlib.suppress(PermissionError):
+                    os.fchown(f.fileno(), old_stat.st_uid, old_stat.st_gid)
+            f.write("\n".join(lines).encode("utf-8"))
+        tmp_path.replace(env_path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            tmp_path.unlink()
+        raise
 
 
 def ensure_directories(*paths: str | Path) -> None:
@@ -80,8 +80,9 @@ def setup_logging(
 
 
 def log_sensor_reading(data: dict, logger: logging.Logger) -> None:
-    """Log sensor reading with nice formatting."""
-    logger.debug(f" Sensor reading: {len(data)} fields")
+    """Log sensor reading with nice formatting (fields that were actually read)."""
+    fields = sum(value is not None for value in data.values())
+    logger.debug(f" Sensor reading: {fields} fields")
 
 
 def log_batch_write(count: int, path: Path, duration: float, logger: logging.Logger) -> None: